@@ -1,12 +1,137 @@
 
 import numpy as np
 import re
+import os
+import copy
+import functools
+from array import array
+
+try:
+    from numba import njit
+except ImportError: # Numba é opcional; sem ele usa-se np.add.at
+    njit = None
+
+__all__ = ['parse_model_from_txt']
+
+_VAR_RE = re.compile(r'x(\d+)')
+_TERM_RE = re.compile(r'([+-]?\s*\d*\.?\d*)\s*(x(\d+))')
+
+# Palavras-chave buscadas sem diferenciar maiúsculas, sem alocar cópias em minúsculas
+_ST_RE = re.compile(r's\.t\.', re.I)
+_FREE_RE = re.compile(r'free', re.I)
+_NEG_RE = re.compile(r'negative', re.I)
+
+# Coeficientes implícitos (ex: "x1", "+x1", "-x1") resolvidos sem chamar float()
+_SIGN_FAST = {'': 1.0, '+': 1.0, '-': -1.0}
+_NOSPACE = str.maketrans('', '', ' \t')
+
+def _split_constraint(line):
+    """
+    Separa uma restrição em (lado esquerdo, sinal, lado direito) procurando
+    diretamente os operadores '<=', '>=' e '=', nessa ordem.
+    """
+    i = line.find('<=')
+    if i >= 0: return line[:i], '<=', line[i+2:]
+    i = line.find('>=')
+    if i >= 0: return line[:i], '>=', line[i+2:]
+    i = line.find('=')
+    if i >= 0: return line[:i], '=', line[i+1:]
+    raise ValueError(f"Formato de restrição inválido: {line}")
+
+def _var_ordinal(name, number, var_index, var_numbers):
+    """
+    Retorna o índice denso (ordem de descoberta) da variável `name`, registrando-a
+    em `var_index` (nome -> índice) e seu número em `var_numbers` se for nova.
+    """
+    k = var_index.get(name)
+    if k is None:
+        k = var_index[name] = len(var_numbers)
+        var_numbers.append(int(number))
+    return k
+
+@functools.lru_cache(maxsize=4096)
+def _parse_lhs(expr):
+    """
+    Converte uma expressão linear em tuplas paralelas (nomes, números, coeficientes)
+    de seus termos. Memoizada: modelos com expressões repetidas (comuns em modelos
+    gerados por template) evitam a varredura por regex.
+    """
+    names, numbers, coeffs = [], [], []
+    for term in _TERM_RE.finditer(expr):
+        coeff_str = term.group(1)
+        if ' ' in coeff_str or '\t' in coeff_str: coeff_str = coeff_str.translate(_NOSPACE)
+        coeff = _SIGN_FAST.get(coeff_str)
+        if coeff is None: coeff = float(coeff_str)
+        names.append(term.group(2))
+        numbers.append(term.group(3))
+        coeffs.append(coeff)
+    return tuple(names), tuple(numbers), tuple(coeffs)
+
+def _scan_terms(expr, ks, coeffs, var_index, var_numbers):
+    """
+    Extrai os termos de uma expressão linear, acrescentando o índice denso de cada
+    variável em `ks` e seu coeficiente em `coeffs` (buffers tipados `array('q')` e
+    `array('d')`). Retorna o número de termos encontrados.
+    """
+    names, numbers, expr_coeffs = _parse_lhs(expr)
+    for name, number in zip(names, numbers):
+        k = var_index.get(name)
+        if k is None: k = _var_ordinal(name, number, var_index, var_numbers)
+        ks.append(k)
+    coeffs.extend(expr_coeffs)
+    return len(names)
+
+if njit is not None:
+    @njit(cache=True)
+    def _scatter_2d(A, rows, cols, coeffs):
+        for k in range(rows.size):
+            A[rows[k], cols[k]] += coeffs[k]
+
+    @njit(cache=True)
+    def _scatter_1d(c, cols, coeffs):
+        for k in range(cols.size):
+            c[cols[k]] += coeffs[k]
+else:
+    def _scatter_2d(A, rows, cols, coeffs):
+        np.add.at(A, (rows, cols), coeffs)
+
+    def _scatter_1d(c, cols, coeffs):
+        np.add.at(c, cols, coeffs)
+
+def _scatter_terms(out, rows, ks, coeffs, var_col0, var_col1, var_mult):
+    """
+    Acumula em `out` (vetor c, ou matriz A quando `rows` é dado) os termos descritos
+    por índices de variável `ks` e coeficientes `coeffs`, usando os arrays de
+    metadados das variáveis. Variáveis livres (var_col1 >= 0) contribuem também
+    com -coef na coluna da parte negativa.
+    """
+    # Os buffers tipados são vistos como ndarrays sem cópia nem conversão de objetos Python
+    ks = np.frombuffer(ks, dtype=np.int64)
+    coeffs = np.frombuffer(coeffs, dtype=np.float64)
+    col1 = var_col1[ks]
+    free = col1 >= 0
+    cols = np.concatenate([var_col0[ks], col1[free]])
+    vals = np.concatenate([coeffs * var_mult[ks], -coeffs[free]])
+    if rows is None:
+        _scatter_1d(out, cols, vals)
+    else:
+        rows = np.frombuffer(rows, dtype=np.int64)
+        _scatter_2d(out, np.concatenate([rows, rows[free]]), cols, vals)
 
 def parse_model_from_txt(filepath, to_standard_form=False):
     """
     Analisa um arquivo de texto (.txt) contendo um modelo de Programação Linear (PL)
     e o converte para um formato matricial.
 
+    Formato do Arquivo de Modelo Esperado:
+    - A primeira linha deve ser a função objetivo (ex: "max 3x1 + 5x2").
+    - A linha "s.t." (subject to) deve separar o objetivo das restrições.
+    - Cada restrição deve estar em uma nova linha (ex: "x1 + 2x2 <= 10").
+    - Sinais aceitos para restrições: '<=', '>=', '='.
+    - Especificações de domínio são opcionais e podem vir antes ou depois das
+      restrições (ex: "x1 free", "x3 negative"). Variáveis não especificadas
+      são consideradas não-negativas (>= 0) por padrão.
+
     Args:
         filepath (str): O caminho para o arquivo .txt contendo o modelo de PL.
         to_standard_form (bool): Se True, converte o modelo para a forma padrão
@@ -15,97 +140,140 @@ def parse_model_from_txt(filepath, to_standard_form=False):
 
     Returns:
         dict: Um dicionário contendo a estrutura do problema de PL processado.
+              'c', 'A' e 'b' são retornados como np.ndarray (A com forma m x n).
+
+    O resultado é memoizado em memória (por caminho, data de modificação, tamanho e
+    inode do arquivo), evitando reprocessar modelos inalterados dentro do mesmo processo.
+    """
+    filepath = os.path.abspath(filepath)
+    st = os.stat(filepath)
+    # Tamanho e inode completam a data de modificação em sistemas de arquivos com
+    # resolução de tempo grosseira (regravações no mesmo instante)
+    file_key = (st.st_mtime_ns, st.st_size, st.st_ino)
+    # Cópia profunda: o chamador (ex: Simplex) pode alterar as listas retornadas
+    return copy.deepcopy(_cached_parse(filepath, file_key, to_standard_form))
+
+@functools.lru_cache(maxsize=128)
+def _cached_parse(filepath, file_key, to_standard_form):
+    """
+    Lê e processa o modelo; `file_key` (data de modificação, tamanho e inode) entra na
+    chave do cache para que alterações no arquivo invalidem o resultado memoizado.
     """
-    with open(filepath, 'r') as f:
-        lines = [line.strip() for line in f.readlines() if line.strip()]
+    with open(filepath, encoding='utf-8') as f:
+        return _parse_model(f, to_standard_form)
+
+def _parse_model(f, to_standard_form):
+    """
+    Processa um modelo de PL lido linha a linha do arquivo aberto `f`, sem carregar o
+    texto inteiro na memória. Veja `parse_model_from_txt` para o formato do resultado.
+    """
+    # Primeira passada, só contando: toda restrição contém ao menos um '=', então a
+    # contagem limita o número de restrições e permite pré-alocar b e signs
+    capacity = sum(raw.count('=') for raw in f)
+    f.seek(0)
+    b_transformed = np.empty(capacity)
+    signs_transformed = [None] * capacity
+    num_constraints = 0
+
+    # As linhas são consumidas uma a uma: o objetivo é processado de imediato e as
+    # demais linhas são classificadas e varridas conforme chegam
+    lines = (line for line in (raw.strip() for raw in f) if line)
+
+    objective_line = next(lines, None)
+    if objective_line is None:
+        raise ValueError("O arquivo do modelo está vazio.")
+    # Só o início da linha define o sentido da otimização
+    head = objective_line[:3].lower()
+    is_max = head == 'max'
+    is_min = head == 'min'
+    if not (is_max or is_min):
+        raise ValueError("A função objetivo deve começar com 'max' ou 'min'")
+
+    # Uma única varredura por linha extrai os termos e o conjunto de variáveis.
+    # Cada variável recebe um índice denso (ordem de descoberta) usado nos arrays de metadados.
+    var_index, var_numbers = {}, [] # nome -> índice denso; índice denso -> número (ex: 'x12' -> 12)
+    obj_expr = objective_line[3:].strip()
+    obj_ks, obj_coeffs = array('q'), array('d')
+    _scan_terms(obj_expr, obj_ks, obj_coeffs, var_index, var_numbers)
 
-    objective_line = lines[0]
-    constraints_lines = []
+    # Termos das restrições em buffers contíguos tipados (crescimento geométrico amortizado)
+    rows, ks, coeffs = array('q'), array('q'), array('d')
     domain_spec_lines = []
 
     s_t_found = False
-    for line in lines[1:]:
-        if 's.t.' in line.lower():
+    for line in lines:
+        if _ST_RE.search(line) is not None:
             s_t_found = True
             continue
-        if not s_t_found: continue
 
-        if any(op in line for op in ['<=', '>=', '=']):
-            constraints_lines.append(line)
+        # Linhas antes de s.t. (exceto o objetivo) e linhas sem operador são especificações de domínio
+        if s_t_found and any(op in line for op in ['<=', '>=', '=']):
+            lhs_expr, sign, rhs_str = _split_constraint(line)
+            n_terms = _scan_terms(lhs_expr, ks, coeffs, var_index, var_numbers)
+            rows.extend([num_constraints] * n_terms)
+            signs_transformed[num_constraints] = sign
+            b_transformed[num_constraints] = float(rhs_str.strip())
+            num_constraints += 1
         else:
-            domain_spec_lines.append(line)
+            vars_in_line = set()
+            for var in _VAR_RE.finditer(line):
+                vars_in_line.add(var.group(0))
+                _var_ordinal(var.group(0), var.group(1), var_index, var_numbers)
+            domain_spec_lines.append((line, vars_in_line))
 
-    is_max = 'max' in objective_line.lower()
-    is_min = 'min' in objective_line.lower()
-    if not (is_max or is_min):
-        raise ValueError("A função objetivo deve começar com 'max' ou 'min'")
+    b_transformed = b_transformed[:num_constraints]
+    del signs_transformed[num_constraints:]
 
-    all_text = ' '.join(lines)
-    original_var_names_set = set(re.findall(r'x\d+', all_text))
-    if not original_var_names_set:
+    if not var_index:
         raise ValueError("Nenhuma variável (ex: x1, x2) encontrada no modelo.")
-    sorted_original_vars = sorted(list(original_var_names_set), key=lambda v: int(v[1:]))
+    var_names = list(var_index)
+    sorted_ks = sorted(range(len(var_numbers)), key=var_numbers.__getitem__)
+    sorted_original_vars = [var_names[k] for k in sorted_ks]
 
     free_vars, negative_vars = set(), set()
-    for line in domain_spec_lines:
-        vars_in_line = set(re.findall(r'x\d+', line))
-        if 'free' in line.lower():
+    for line, vars_in_line in domain_spec_lines:
+        if _FREE_RE.search(line) is not None:
             free_vars.update(vars_in_line)
-        elif 'negative' in line.lower():
+        elif _NEG_RE.search(line) is not None:
             negative_vars.update(vars_in_line)
     if free_vars.intersection(negative_vars):
         raise ValueError(f"Variáveis conflitantes: {free_vars.intersection(negative_vars)}")
 
+    # Metadados das variáveis em arrays paralelos indexados pelo índice denso
+    var_col0 = np.full(len(var_names), -1, dtype=np.intp)
+    var_col1 = np.full(len(var_names), -1, dtype=np.intp) # Coluna da parte negativa (só livres)
+    var_mult = np.ones(len(var_names))
+
     simplex_vars_map, simplex_var_column_names = {}, []
     current_simplex_col = 0
-    for var_orig in sorted_original_vars:
+    for k in sorted_ks:
+        var_orig = var_names[k]
+        var_col0[k] = current_simplex_col
         if var_orig in free_vars:
             p, n = f"{var_orig}_p", f"{var_orig}_n"
             simplex_var_column_names.extend([p, n])
             simplex_vars_map[var_orig] = {'type': 'free', 'cols_parser': [current_simplex_col, current_simplex_col + 1], 'mult': 1, 'simplex_names': [p, n]}
+            var_col1[k] = current_simplex_col + 1
             current_simplex_col += 2
         elif var_orig in negative_vars:
             p = f"{var_orig}_prime"
             simplex_var_column_names.append(p)
             simplex_vars_map[var_orig] = {'type': 'negative', 'cols_parser': [current_simplex_col], 'mult': -1, 'simplex_names': [p]}
+            var_mult[k] = -1.0
             current_simplex_col += 1
         else:
             simplex_var_column_names.append(var_orig)
             simplex_vars_map[var_orig] = {'type': 'non_negative', 'cols_parser': [current_simplex_col], 'mult': 1, 'simplex_names': [var_orig]}
             current_simplex_col += 1
-    
+
     num_simplex_vars = len(simplex_var_column_names)
     c_transformed = np.zeros(num_simplex_vars)
-    obj_expr = objective_line.lower().replace('max', '').replace('min', '').strip()
-    for term in re.finditer(r'([+-]?\s*\d*\.?\d*)\s*(x\d+)', obj_expr):
-        coeff_str, var_orig = term.group(1).replace(' ', ''), term.group(2)
-        coeff = float(coeff_str) if coeff_str not in ['+', '', '-'] else (1.0 if coeff_str in ['+', ''] else -1.0)
-        info = simplex_vars_map[var_orig]
-        if info['type'] == 'free':
-            c_transformed[info['cols_parser'][0]] += coeff
-            c_transformed[info['cols_parser'][1]] -= coeff
-        else:
-            c_transformed[info['cols_parser'][0]] += coeff * info['mult']
+    _scatter_terms(c_transformed, None, obj_ks, obj_coeffs, var_col0, var_col1, var_mult)
 
     if is_min: c_transformed = -c_transformed
 
-    A_transformed, b_transformed, signs_transformed = [], [], []
-    for line in constraints_lines:
-        match = re.match(r'(.+?)\s*(<=|>=|=)\s*([^<>=]+)', line)
-        lhs_expr, sign, rhs_str = match.groups()
-        signs_transformed.append(sign)
-        b_transformed.append(float(rhs_str.strip()))
-        row = np.zeros(num_simplex_vars)
-        for term in re.finditer(r'([+-]?\s*\d*\.?\d*)\s*(x\d+)', lhs_expr):
-            coeff_str, var_orig = term.group(1).replace(' ', ''), term.group(2)
-            coeff = float(coeff_str) if coeff_str not in ['+', '', '-'] else (1.0 if coeff_str in ['+', ''] else -1.0)
-            info = simplex_vars_map[var_orig]
-            if info['type'] == 'free':
-                row[info['cols_parser'][0]] += coeff
-                row[info['cols_parser'][1]] -= coeff
-            else:
-                row[info['cols_parser'][0]] += coeff * info['mult']
-        A_transformed.append(list(row))
+    A_transformed = np.zeros((num_constraints, num_simplex_vars))
+    _scatter_terms(A_transformed, rows, ks, coeffs, var_col0, var_col1, var_mult)
 
     interpretation_info = {
         'sorted_original_vars': sorted_original_vars,
@@ -114,33 +282,31 @@ def parse_model_from_txt(filepath, to_standard_form=False):
     }
 
     if to_standard_form:
-        num_constraints = len(A_transformed)
-        slack_surplus_cols = []
+        num_slacks = sum(1 for sign in signs_transformed if sign != '=')
+        slack_surplus_matrix = np.zeros((num_constraints, num_slacks))
         new_var_names = []
-        
+
+        j = 0
         for i, sign in enumerate(signs_transformed):
             if sign == '<=':
-                col = np.zeros(num_constraints)
-                col[i] = 1
-                slack_surplus_cols.append(col)
+                slack_surplus_matrix[i, j] = 1.0
                 new_var_names.append(f"s{i+1}")
+                j += 1
             elif sign == '>=':
-                col = np.zeros(num_constraints)
-                col[i] = -1
-                slack_surplus_cols.append(col)
+                slack_surplus_matrix[i, j] = -1.0
                 new_var_names.append(f"e{i+1}")
-        
-        if slack_surplus_cols:
-            slack_surplus_matrix = np.array(slack_surplus_cols).T
-            A_transformed = np.hstack([np.array(A_transformed), slack_surplus_matrix])
-            c_transformed = np.hstack([c_transformed, np.zeros(len(new_var_names))])
+                j += 1
+
+        if num_slacks:
+            A_transformed = np.concatenate([A_transformed, slack_surplus_matrix], axis=1)
+            c_transformed = np.concatenate([c_transformed, np.zeros(num_slacks)])
             interpretation_info['simplex_var_column_names'].extend(new_var_names)
-        
+
         signs_transformed = ['='] * num_constraints
 
     return {
-        'c': list(c_transformed),
-        'A': A_transformed.tolist() if isinstance(A_transformed, np.ndarray) else A_transformed,
+        'c': c_transformed,
+        'A': A_transformed,
         'b': b_transformed,
         'signs': signs_transformed,
         'was_min': is_min,
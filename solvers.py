@@ -1,8 +1,293 @@
 import numpy as np
-from scipy.linalg import inv
+import warnings
+from scipy.linalg import lu_factor, lu_solve, LinAlgWarning
+
+try:
+    from numba import njit, prange
+except ImportError: # Numba é opcional; sem ele o Simplex Tabular usa o NumPy
+    njit, prange = None, range
+
+def _factor_basis(B):
+    """
+        Calcula a fatoração LU da matriz básica B. B é sobrescrita pelos fatores (sem cópia
+        quando está em ordem de colunas), então deve ser um buffer do próprio chamador.
+
+        Returns:
+            tuple | None: Os fatores (lu, piv) para uso com `lu_solve`, ou None se B for singular.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', LinAlgWarning)
+        lu, piv = lu_factor(B, overwrite_a=True, check_finite=False)
+    if not np.all(np.diag(lu)):
+        return None
+    return lu, piv
+
+# Número máximo de matrizes eta acumuladas antes de refatorar a base do zero
+_REFACTOR_INTERVAL = 50
+
+# Em precisão reduzida (float32): no tabular, intervalo de pivoteamentos entre recálculos do lado
+# direito em float64; no revisado, intervalo de refatoração da base (x_B é refinado em float64
+# apenas no ótimo)
+_REFINE_INTERVAL = 20
+
+def _solve_basis_float64(B, b):
+    """
+        Recalcula x_B = B^-1 b em float64 a partir dos dados originais (refinamento iterativo
+        das soluções obtidas em precisão reduzida).
+
+        Returns:
+            np.array | None: A solução em float64, ou None se B for singular.
+    """
+    lu_piv = _factor_basis(np.array(B, dtype=np.float64, order='F'))
+    if lu_piv is None:
+        return None
+    return lu_solve(lu_piv, np.asarray(b, dtype=np.float64), check_finite=False)
+
+class _EtaFile:
+    """
+        Inversa da base na forma produto (PFI): a fatoração LU de uma base de referência
+        B0 seguida de uma matriz eta por pivoteamento, de modo que B^-1 = E_k^-1 ... E_1^-1 B0^-1.
+        Cada pivoteamento custa O(m) para registrar, em vez de uma nova fatoração O(m^3).
+    """
+    def __init__(self, lu_piv):
+        self.lu_piv = lu_piv
+        self.etas = []
+
+    def ftran(self, v):
+        """Resolve B x = v (v pode ser um vetor ou uma matriz de colunas)."""
+        x = lu_solve(self.lu_piv, v, check_finite=False)
+        for r, eta in self.etas:
+            x_r = x[r] / eta[r]
+            x -= np.multiply.outer(eta, x_r)
+            x[r] = x_r
+        return x
+
+    def btran(self, c):
+        """Resolve y B = c (isto é, B^T y = c)."""
+        u = np.array(c, dtype=self.lu_piv[0].dtype)
+        for r, eta in reversed(self.etas):
+            u[r] = (u[r] - (u @ eta - u[r] * eta[r])) / eta[r]
+        return lu_solve(self.lu_piv, u, trans=1, overwrite_b=True, check_finite=False)
+
+    def update(self, r, eta):
+        """Registra o pivoteamento na linha r com a coluna eta = B^-1 a_q da variável que entra."""
+        self.etas.append((r, eta))
+
+# Após este número de pivoteamentos degenerados seguidos, os motores passam à regra de Bland
+# (menor índice na entrada e no desempate da saída), que impede a ciclagem
+_BLAND_AFTER = 10
+
+# Número de colunas por bloco no pricing parcial do Simplex Revisado
+_PRICING_BLOCK = 256
+
+def _partial_pricing(c, A, y, in_basis, first_block, tol):
+    """
+        Pricing parcial: percorre as colunas em blocos contíguos a partir de `first_block`
+        (voltando ao início ao passar do último) e para no primeiro bloco com custo reduzido
+        maior que `tol`, escolhendo o maior custo reduzido dentro dele.
+
+        Returns:
+            tuple: O índice da variável que entra e seu custo reduzido, ou (-1, 0.0) se
+                nenhuma coluna melhora o objetivo (solução ótima).
+    """
+    num_vars = A.shape[1]
+    num_blocks = -(-num_vars // _PRICING_BLOCK)
+    for k in range(num_blocks):
+        lo = (first_block + k) % num_blocks * _PRICING_BLOCK
+        hi = min(lo + _PRICING_BLOCK, num_vars)
+        cj_zj = c[lo:hi] - y @ A[:, lo:hi]
+        cj_zj[in_basis[lo:hi]] = -np.inf
+        j = int(np.argmax(cj_zj))
+        if cj_zj[j] > tol:
+            return lo + j, cj_zj[j]
+    return -1, 0.0
+
+# Códigos de retorno das iterações do Simplex Tabular
+_OPTIMAL, _UNBOUNDED, _NUMERICAL_INSTABILITY, _MAX_ITERATIONS = 0, 1, 2, 3
+
+def _tabular_iterations(tableau, basic_indices, c_original, max_iter, tol):
+    """
+        Executa as iterações do Simplex Tabular com operações vetorizadas do NumPy.
+        `tableau` e `basic_indices` são atualizados no lugar; `tol` é a tolerância numérica
+        usada nos testes de otimalidade, de razão e de pivô.
+
+        Durante as iterações o lado direito e a coluna de pivô ficam em vetores contíguos
+        próprios (em vez de colunas com passo de uma linha inteira do tableau); o lado
+        direito é devolvido à última coluna do tableau ao final.
+
+        Returns:
+            tuple: O código de status e o vetor de custos reduzidos (cj - zj) da última iteração.
+    """
+    m = tableau.shape[0]
+    coeffs = tableau[:, :-1]
+    rhs = tableau[:, -1].copy()
+    cj_zj = np.zeros(coeffs.shape[1]) # Definido mesmo quando max_iter == 0
+    status = _MAX_ITERATIONS
+    degenerate_streak = 0
+    for _ in range(max_iter):
+        # Calcula os custos reduzidos (linha cj - zj)
+        cb = c_original[basic_indices]
+        zj = cb @ coeffs
+        cj_zj = c_original - zj
+
+        # Zera os custos reduzidos das variáveis básicas por precisão numérica
+        cj_zj[basic_indices] = 0
+
+        # Condição de otimalidade
+        if np.all(cj_zj <= tol):
+            status = _OPTIMAL
+            break
+
+        # Escolhe a variável para entrar na base (regra de Bland após muitos pivoteamentos
+        # degenerados seguidos) e copia sua coluna uma única vez
+        bland = degenerate_streak > _BLAND_AFTER
+        entering_col = np.argmax(cj_zj > tol) if bland else np.argmax(cj_zj)
+        pivot_col = coeffs[:, entering_col].copy()
+        
+        # Condição de solução ilimitada
+        if np.all(pivot_col <= tol):
+            status = _UNBOUNDED
+            break
+
+        # Teste da razão para escolher a variável que sai da base
+        ratios = np.full(m, np.inf)
+        np.divide(rhs, pivot_col, out=ratios, where=pivot_col > tol)
+        leaving_row = int(np.argmin(ratios))
+        if bland: # Empates na razão mínima: sai a variável básica de menor índice
+            ties = np.flatnonzero(ratios == ratios[leaving_row])
+            leaving_row = int(ties[np.argmin(basic_indices[ties])])
+        degenerate_streak = degenerate_streak + 1 if rhs[leaving_row] <= tol else 0
+        
+        # Realiza o pivoteamento para atualizar o tableau
+        pivot_element = pivot_col[leaving_row]
+        if abs(pivot_element) < tol:
+            status = _NUMERICAL_INSTABILITY
+            break
+        
+        coeffs[leaving_row, :] /= pivot_element
+        rhs[leaving_row] /= pivot_element
+        for i in range(m):
+            if i != leaving_row:
+                coeffs[i, :] -= pivot_col[i] * coeffs[leaving_row, :]
+                rhs[i] -= pivot_col[i] * rhs[leaving_row]
+        
+        # Atualiza a base
+        basic_indices[leaving_row] = entering_col
+
+    tableau[:, -1] = rhs
+    return status, cj_zj
+
+# Abaixo deste número de linhas a eliminação paralela não compensa o custo das threads
+_PARALLEL_MIN_ROWS = 64
+
+def _eliminate_rows(tableau, rhs, pivot_col, leaving_row):
+    """Zera a coluna de pivô nas demais linhas (a linha de pivô já está normalizada)."""
+    m, num_vars = tableau.shape[0], tableau.shape[1] - 1
+    for i in range(m):
+        if i != leaving_row:
+            factor = pivot_col[i]
+            for j in range(num_vars):
+                tableau[i, j] -= factor * tableau[leaving_row, j]
+            rhs[i] -= factor * rhs[leaving_row]
+
+def _eliminate_rows_parallel(tableau, rhs, pivot_col, leaving_row):
+    """Versão de `_eliminate_rows` com as linhas distribuídas entre threads."""
+    m, num_vars = tableau.shape[0], tableau.shape[1] - 1
+    for i in prange(m):
+        if i != leaving_row:
+            factor = pivot_col[i]
+            for j in range(num_vars):
+                tableau[i, j] -= factor * tableau[leaving_row, j]
+            rhs[i] -= factor * rhs[leaving_row]
+
+def _tabular_iterations_loops(tableau, basic_indices, c_original, max_iter, tol):
+    """
+        Mesmas iterações de `_tabular_iterations`, escritas com laços explícitos para
+        compilação com Numba (cada passo vira um único laço nativo, sem temporários).
+    """
+    m, width = tableau.shape
+    num_vars = width - 1
+    cj_zj = np.zeros(num_vars)
+    zj = np.empty(num_vars)
+    # Lado direito e coluna de pivô em vetores contíguos, lidos com passo unitário
+    rhs = tableau[:, num_vars].copy()
+    pivot_col = np.empty(m, dtype=tableau.dtype)
+    status = _MAX_ITERATIONS
+    degenerate_streak = 0
+    for _ in range(max_iter):
+        # Custos reduzidos cj - zj, zerados nas variáveis básicas (percorre o tableau por linhas)
+        zj[:] = 0.0
+        for i in range(m):
+            cb_i = c_original[basic_indices[i]]
+            for j in range(num_vars):
+                zj[j] += cb_i * tableau[i, j]
+        for j in range(num_vars):
+            cj_zj[j] = c_original[j] - zj[j]
+        for i in range(m):
+            cj_zj[basic_indices[i]] = 0.0
+
+        # Variável que entra: maior custo reduzido (primeiro em caso de empate) ou, na regra
+        # de Bland, o primeiro com custo reduzido positivo
+        bland = degenerate_streak > _BLAND_AFTER
+        entering_col = 0
+        for j in range(1, num_vars):
+            if bland and cj_zj[entering_col] > tol:
+                break
+            if cj_zj[j] > cj_zj[entering_col]:
+                entering_col = j
+        if cj_zj[entering_col] <= tol:
+            status = _OPTIMAL
+            break
+
+        # Coluna de pivô copiada uma vez e reutilizada no teste da razão e na eliminação
+        for i in range(m):
+            pivot_col[i] = tableau[i, entering_col]
+
+        # Teste da razão sem usar inf; nenhuma linha elegível indica solução ilimitada
+        leaving_row = -1
+        best_ratio = 0.0
+        for i in range(m):
+            a = pivot_col[i]
+            if a > tol:
+                ratio = rhs[i] / a
+                if leaving_row < 0 or ratio < best_ratio or (
+                        bland and ratio == best_ratio and basic_indices[i] < basic_indices[leaving_row]):
+                    leaving_row = i
+                    best_ratio = ratio
+        if leaving_row < 0:
+            status = _UNBOUNDED
+            break
+        if rhs[leaving_row] <= tol:
+            degenerate_streak += 1
+        else:
+            degenerate_streak = 0
+
+        pivot_element = pivot_col[leaving_row]
+        if abs(pivot_element) < tol:
+            status = _NUMERICAL_INSTABILITY
+            break
+
+        for j in range(num_vars):
+            tableau[leaving_row, j] /= pivot_element
+        rhs[leaving_row] /= pivot_element
+        if m >= _PARALLEL_MIN_ROWS:
+            _eliminate_rows_parallel(tableau, rhs, pivot_col, leaving_row)
+        else:
+            _eliminate_rows(tableau, rhs, pivot_col, leaving_row)
+
+        basic_indices[leaving_row] = entering_col
+
+    tableau[:, num_vars] = rhs
+    return status, cj_zj
+
+_tabular_iterations_jit = None
+if njit is not None:
+    _eliminate_rows = njit(cache=True, boundscheck=False)(_eliminate_rows)
+    _eliminate_rows_parallel = njit(cache=True, parallel=True, boundscheck=False)(_eliminate_rows_parallel)
+    _tabular_iterations_jit = njit(cache=True, boundscheck=False)(_tabular_iterations_loops)
 
 class Simplex:
-    def __init__(self, c_from_parser, A_from_parser, b, signs, was_min=False, interpretation_info=None):
+    def __init__(self, c_from_parser, A_from_parser, b, signs, was_min=False, interpretation_info=None, dtype=np.float64):
         """
         Inicializa o solver Simplex com os dados do problema de Programação Linear.
 
@@ -13,8 +298,14 @@ class Simplex:
             signs (list): Lista com os sinais de cada restrição ('<=', '>=', '=').
             was_min (bool, optional): True se o problema original era de minimização. Default é False.
             interpretation_info (dict, optional): Dicionário com dados para mapear a solução de volta às variáveis originais.
+            dtype (np.dtype, optional): Precisão das matrizes de trabalho. Com np.float32 as iterações
+                                        usam metade da memória e a solução é refinada em float64
+                                        sobre os dados originais, que são mantidos em float64.
+                                        Default é np.float64.
         """
 
+        self.dtype = np.dtype(dtype)
+        self.tol = 1e-9 if self.dtype == np.float64 else 1e-5 # Tolerância compatível com a precisão
         self.c_parser_vars = np.array(c_from_parser, dtype=float)
         self.A_parser_vars = np.array(A_from_parser, dtype=float)
         self.b_orig = np.array(b, dtype=float)
@@ -28,6 +319,21 @@ class Simplex:
         self.c = None
         self.b = None
         self.num_vars = None
+        self.pricing = 'dantzig'
+
+        # Índices para traduzir a solução às variáveis originais com uma única operação vetorizada
+        if interpretation_info is not None:
+            vars_map = interpretation_info['simplex_vars_map']
+            infos = [vars_map[v] for v in interpretation_info['sorted_original_vars']]
+            free = [(k, info['cols_parser']) for k, info in enumerate(infos) if info['type'] == 'free']
+            nonfree = [(k, info['cols_parser'][0], info['mult']) for k, info in enumerate(infos) if info['type'] != 'free']
+            self._n_orig_vars = len(infos)
+            self._free_out_idx = np.array([k for k, _ in free], dtype=np.intp)
+            self._free_pos_idx = np.array([cols[0] for _, cols in free], dtype=np.intp)
+            self._free_neg_idx = np.array([cols[1] for _, cols in free], dtype=np.intp)
+            self._nonfree_out_idx = np.array([k for k, _, _ in nonfree], dtype=np.intp)
+            self._nonfree_idx = np.array([col for _, col, _ in nonfree], dtype=np.intp)
+            self._nonfree_mult = np.array([mult for _, _, mult in nonfree], dtype=float)
 
     def _prepare_problem(self):
         """
@@ -42,40 +348,50 @@ class Simplex:
             as variáveis de decisão originais e as de folga/excesso.
         """
 
-        self.b = np.copy(self.b_orig)
+        # Atributos usados nos laços ficam em variáveis locais
+        m, n_parser, signs = self.m, self.n_parser_vars, self.signs
+        b = np.copy(self.b_orig)
         temp_A = np.copy(self.A_parser_vars)
         
-        for i in range(self.m):
-            if self.b[i] < 0:
-                self.b[i] *= -1
+        for i in range(m):
+            if b[i] < 0:
+                b[i] *= -1
                 temp_A[i, :] *= -1
-                if self.signs[i] == '<=': self.signs[i] = '>='
-                elif self.signs[i] == '>=': self.signs[i] = '<='
+                if signs[i] == '<=': signs[i] = '>='
+                elif signs[i] == '>=': signs[i] = '<='
 
         # Calcula o número de variáveis de folga/excesso
-        num_slack_vars = sum(1 for sign in self.signs if sign != '=')
-        self.num_vars = self.n_parser_vars + num_slack_vars
+        num_slack_vars = sum(1 for sign in signs if sign != '=')
+        num_vars = n_parser + num_slack_vars
         
-        # Cria a matriz A e o vetor c na forma padrão
-        self.A = np.zeros((self.m, self.num_vars))
-        self.A[:, :self.n_parser_vars] = temp_A
-        self.c = np.zeros(self.num_vars)
-        self.c[:self.n_parser_vars] = self.c_parser_vars
+        # Cria a matriz A e o vetor c na forma padrão; A fica em ordem de colunas (Fortran),
+        # pois o Simplex Revisado a acessa por colunas (A[:, j], A[:, base], y @ A)
+        A = np.zeros((m, num_vars), order='F')
+        A[:, :n_parser] = temp_A
+        c = np.zeros(num_vars)
+        c[:n_parser] = self.c_parser_vars
 
         # Adiciona as variáveis de folga/excesso
-        slack_ptr = self.n_parser_vars
-        for i, sign in enumerate(self.signs):
+        slack_ptr = n_parser
+        for i, sign in enumerate(signs):
             if sign == '<=':
-                self.A[i, slack_ptr] = 1.0
+                A[i, slack_ptr] = 1.0
                 slack_ptr += 1
             elif sign == '>=':
-                self.A[i, slack_ptr] = -1.0
+                A[i, slack_ptr] = -1.0
                 slack_ptr += 1
 
+        # Forma padrão em float64, usada no refinamento; em float64 são as próprias matrizes
+        # de trabalho, sem cópia
+        self._A64, self._b64, self._c64 = A, b, c
+        if self.dtype != np.float64:
+            A, b, c = A.astype(self.dtype, order='F'), b.astype(self.dtype), c.astype(self.dtype)
+        self.A, self.b, self.c, self.num_vars = A, b, c, num_vars
+
     # --------------------------------------------------------------------------
     # FLUXO DE SOLUÇÃO PRINCIPAL
     # --------------------------------------------------------------------------
-    def solve(self, method='revised'):
+    def solve(self, method='revised', pricing='dantzig'):
         """
             Ponto de entrada principal para resolver o problema de Programação Linear.
 
@@ -85,12 +401,24 @@ class Simplex:
             Args:
                 method (str, optional): O método a ser usado. Pode ser 'tabular' ou 'revised'.
                                         Default é 'revised'.
+                pricing (str, optional): Regra de escolha da variável que entra no método
+                                         revisado. Pode ser 'dantzig' (maior custo reduzido),
+                                         'devex' (custo reduzido ponderado por pesos de
+                                         referência) ou 'partial' (maior custo reduzido no
+                                         primeiro bloco de colunas que melhora o objetivo,
+                                         em rodízio). Default é 'dantzig'. O método
+                                         tabular aceita apenas 'dantzig'.
 
             Returns:
                 dict: Um dicionário contendo o status final da otimização ('optimal', 
                     'infeasible', 'unbounded', etc.), a solução encontrada (se houver) e 
                     outras informações relevantes.
         """
+        if pricing not in ('dantzig', 'devex', 'partial'):
+            raise ValueError("Regra de pricing inválida. Escolha 'dantzig', 'devex' ou 'partial'.")
+        if method == 'tabular' and pricing != 'dantzig':
+            raise ValueError("O método tabular suporta apenas a regra de pricing 'dantzig'.")
+        self.pricing = pricing
         self._prepare_problem()
         
         if method == 'revised':
@@ -125,8 +453,17 @@ class Simplex:
         
         initial_base_indices = phase1_result['base']
         
-         # Fase 2: Encontrar a solução ótima
-        return self._revised_simplex_engine(self.A, self.b, self.c, initial_base_indices)
+         # Fase 2: Encontrar a solução ótima, reaproveitando a fatoração da base final da Fase 1
+        result = self._revised_simplex_engine(self.A, self.b, self.c, initial_base_indices,
+                                              initial_eta_file=phase1_result.get('eta_file'),
+                                              reference=(self._A64, self._b64, self._c64))
+        if result.get('status') == 'optimal':
+            eta_file = result.pop('eta_file')
+            # A inversa explícita (O(m^3)) só é montada para o resultado bruto, sem
+            # interpretation_info; com ele, `_format_final_solution` a descartaria
+            if self.interpretation_info is None:
+                result['final_B_inv'] = eta_file.ftran(np.eye(self.m))
+        return result
 
     def _run_phase1_revised(self):
         """
@@ -138,51 +475,68 @@ class Simplex:
 
             Returns:
                 dict: Um dicionário com o status.
-                    - {'status': 'feasible', 'base': [...]} se uma base factível for encontrada.
+                    - {'status': 'feasible', 'base': [...], 'eta_file': ...} se uma base factível for
+                      encontrada; 'eta_file' é a fatoração dessa base (ausente se a base for trivial).
                     - {'status': 'infeasible'} se o problema original for infactível.
         """
 
-        # Identifica restrições que precisam de variáveis artificiais
-        artificial_rows = {i for i, sign in enumerate(self.signs) if sign in ['>=', '=']}
+        m, n_parser, signs, A = self.m, self.n_parser_vars, self.signs, self._A64
+        num_std = A.shape[1]
+
+        # Identifica restrições que precisam de variáveis artificiais; uma restrição >= com
+        # b = 0 não precisa, pois sua variável de excesso já é básica factível (valor 0)
+        b = self._b64
+        artificial_rows = {i for i, sign in enumerate(signs) if sign == '=' or (sign == '>=' and b[i] > 0)}
         if not artificial_rows:
-            # Base trivial com vars de folga (se houver)
-            slack_indices = [self.n_parser_vars + i for i, s in enumerate(self.signs) if s != '=']
+            # Base trivial: toda restrição tem folga/excesso, em colunas contíguas
+            slack_indices = np.arange(n_parser, n_parser + m, dtype=np.intp)
             return {'status': 'feasible', 'base': slack_indices}
 
         # Constrói o problema da Fase 1
         num_artificial = len(artificial_rows)
-        A_phase1 = np.hstack([self.A, np.zeros((self.m, num_artificial))])
-        c_phase1 = np.zeros(self.A.shape[1] + num_artificial)
-        c_phase1[self.A.shape[1]:] = -1.0
+        A_phase1 = np.empty((m, num_std + num_artificial), order='F')
+        A_phase1[:, :num_std] = A
+        A_phase1[:, num_std:] = 0.0
+        c_phase1 = np.zeros(num_std + num_artificial)
+        c_phase1[num_std:] = -1.0
         
         # Adiciona variáveis artificiais e define a base inicial da Fase 1
-        initial_base_phase1 = [-1] * self.m
-        art_ptr = self.A.shape[1]
-        slack_ptr = self.n_parser_vars
-        for i in range(self.m):
+        initial_base_phase1 = np.full(m, -1, dtype=np.intp)
+        art_ptr = num_std
+        slack_ptr = n_parser
+        for i in range(m):
             if i in artificial_rows:
                 A_phase1[i, art_ptr] = 1.0
                 initial_base_phase1[i] = art_ptr
                 art_ptr += 1
-            else: # Restrição <=
+                if signs[i] == '>=': # A variável de excesso também ocupa uma coluna de folga
+                    slack_ptr += 1
+            else: # Restrição <= (ou >= com b = 0)
                 initial_base_phase1[i] = slack_ptr
                 slack_ptr += 1
+        # np.take(mode='clip') no motor trocaria um índice -1 pela coluna 0 sem erro
+        assert m == 0 or initial_base_phase1.min() >= 0, "Base inicial da Fase 1 incompleta"
         
-        result_phase1 = self._revised_simplex_engine(A_phase1, self.b, c_phase1, initial_base_phase1)
+        # Montado em float64 (referência do refinamento) e convertido à precisão de trabalho
+        A_work, c_work = A_phase1, c_phase1
+        if self.dtype != np.float64:
+            A_work, c_work = A_phase1.astype(self.dtype, order='F'), c_phase1.astype(self.dtype)
+        result_phase1 = self._revised_simplex_engine(A_work, self.b, c_work, initial_base_phase1,
+                                                     reference=(A_phase1, self._b64, c_phase1))
 
         # Verifica o resultado da Fase 1
-        if result_phase1.get('status') != 'optimal' or abs(result_phase1.get('value', 0)) > 1e-9:
+        if result_phase1.get('status') != 'optimal' or abs(result_phase1.get('value', 0)) > self.tol:
             return {'status': 'infeasible'}
 
         final_base_phase1 = result_phase1['final_basis_indices']
         
         # Verifica se alguma variável artificial permaneceu na base
-        if any(b >= self.A.shape[1] for b in final_base_phase1):
+        if np.any(final_base_phase1 >= num_std):
              return {'status': 'error_redundant_constraint', 'message': 'Não foi possível expulsar as variáveis artificiais da base. O modelo pode ter restrições redundantes.'}
 
-        return {'status': 'feasible', 'base': final_base_phase1}
+        return {'status': 'feasible', 'base': final_base_phase1, 'eta_file': result_phase1['eta_file']}
 
-    def _revised_simplex_engine(self, A, b, c, initial_basic_indices):
+    def _revised_simplex_engine(self, A, b, c, initial_basic_indices, initial_eta_file=None, reference=None):
         """
             Motor principal que executa as iterações do algoritmo Simplex Revisado.
 
@@ -191,46 +545,118 @@ class Simplex:
                 b (np.array): O vetor do lado direito (forma padrão).
                 c (np.array): O vetor de custos (forma padrão).
                 initial_basic_indices (list): Lista de índices das variáveis na base inicial.
+                initial_eta_file (_EtaFile, optional): Fatoração já disponível da base inicial (por
+                                                       exemplo, a da Fase 1), que dispensa a primeira
+                                                       refatoração. Default é None.
+                reference (tuple, optional): Os dados (A, b, c) em float64 usados no refinamento
+                                             da solução em precisão reduzida. Default é (A, b, c).
 
             Returns:
                 dict: Um dicionário descrevendo o resultado da otimização ('optimal', 'unbounded', etc.).
         """
-        basic_indices = np.array(initial_basic_indices, dtype=int)
+        basic_indices = np.array(initial_basic_indices, dtype=np.intp)
         num_vars = A.shape[1]
         
-        for _ in range(self.m * num_vars * 2): # Limite de iterações
-            B = A[:, basic_indices]
-            try:
-                B_inv = inv(B)
-            except np.linalg.LinAlgError:
-                return {'status': 'error_singular_matrix'}
+        # Máscara das variáveis básicas, atualizada em O(1) a cada pivoteamento
+        in_basis = np.zeros(num_vars, dtype=bool)
+        in_basis[basic_indices] = True
+
+        # Pesos de referência do Devex, reiniciados em 1 a cada chamada do motor
+        devex = self.pricing == 'devex'
+        if devex: weights = np.ones(num_vars)
+        partial = self.pricing == 'partial'
+        num_blocks = -(-num_vars // _PRICING_BLOCK)
+
+        tol, m = self.tol, self.m
+        low_precision = A.dtype != np.float64
+        refactor_interval = min(_REFINE_INTERVAL if low_precision else _REFACTOR_INTERVAL, m)
+
+        # Buffer da matriz básica, reaproveitado (e fatorado no lugar) a cada refatoração
+        B = np.empty((m, m), dtype=A.dtype, order='F')
+
+        eta_file = initial_eta_file
+        z = None # Valor da função objetivo, atualizado a cada pivoteamento
+        degenerate_streak = 0
+        for it in range(m * num_vars * 2): # Limite de iterações
+            # Refatora a base periodicamente; entre refatorações, B^-1 é atualizada por matrizes eta
+            if eta_file is None or len(eta_file.etas) >= refactor_interval:
+                np.take(A, basic_indices, axis=1, out=B, mode='clip') # 'clip' evita o buffer intermediário
+                lu_piv = _factor_basis(B)
+                if lu_piv is None:
+                    return {'status': 'error_singular_matrix'}
+                eta_file = _EtaFile(lu_piv)
+                z = None
             
-            non_basic_indices = np.setdiff1d(np.arange(num_vars), basic_indices)
             c_b = c[basic_indices]
-            x_b = B_inv @ b
-            y = c_b @ B_inv
-            cj_zj = c[non_basic_indices] - y @ A[:, non_basic_indices]
+            x_b = eta_file.ftran(b)
+            if z is None: # Recalculado só no início e a cada refatoração, para não acumular erro
+                z = c_b @ x_b
+            y = eta_file.btran(c_b) # y = c_b B^-1
+            bland = degenerate_streak > _BLAND_AFTER
+            if partial and not bland: # Só os blocos de colunas necessários; o bloco inicial avança a cada iteração
+                entering_idx, cj_q = _partial_pricing(c, A, y, in_basis, it % num_blocks, tol)
+                optimal = entering_idx < 0
+            else:
+                # Custos reduzidos de todas as colunas num único produto, sem copiar A[:, N];
+                # as básicas recebem -inf e nunca são escolhidas
+                cj_zj = c - y @ A
+                cj_zj[in_basis] = -np.inf
+                optimal = np.all(cj_zj <= tol)
 
             # Condição de otimalidade
-            if np.all(cj_zj <= 1e-9):
+            if optimal:
+                if partial and not bland: # Custos reduzidos completos para o teste de soluções múltiplas
+                    cj_zj = c - y @ A
+                    cj_zj[in_basis] = -np.inf
+                if low_precision: # Refinamento final de x_B em float64, sobre os dados originais
+                    A_ref, b_ref, c_ref = (A, b, c) if reference is None else reference
+                    x_refined = _solve_basis_float64(A_ref[:, basic_indices], b_ref)
+                    if x_refined is not None: x_b = x_refined
+                    z = np.asarray(c_ref, dtype=np.float64)[basic_indices] @ x_b
                 sol = np.zeros(num_vars)
                 sol[basic_indices] = x_b
-                return {'status': 'optimal', 'solution': sol, 'value': c_b @ x_b,
+                return {'status': 'optimal', 'solution': sol, 'value': z,
                         'is_degenerate': np.any(np.isclose(x_b, 0)),
                         'has_multiple_solutions': np.any(np.isclose(cj_zj, 0)),
-                        'final_basis_indices': basic_indices, 'final_B_inv': B_inv}
+                        'final_basis_indices': basic_indices, 'eta_file': eta_file}
             
             # Escolha da variável que entra na base
-            entering_idx = non_basic_indices[np.argmax(cj_zj)]
-            d = B_inv @ A[:, entering_idx]
+            if bland: # Menor índice com custo reduzido positivo
+                entering_idx = int(np.argmax(cj_zj > tol))
+            elif devex:
+                entering_idx = int(np.argmax(np.where(cj_zj > tol, cj_zj**2 / weights, -1.0)))
+            elif not partial:
+                entering_idx = int(np.argmax(cj_zj))
+            if bland or not partial: cj_q = cj_zj[entering_idx]
+            d = eta_file.ftran(A[:, entering_idx])
             
             # Condição de solução ilimitada
-            if np.all(d <= 1e-9): return {'status': 'unbounded'}
+            if np.all(d <= tol): return {'status': 'unbounded'}
             
             # Teste da razão para escolher a variável que sai da base
-            ratios = np.array([x_b[i] / d[i] if d[i] > 1e-9 else np.inf for i in range(self.m)])
-            leaving_row = np.argmin(ratios)
+            ratios = np.full(m, np.inf)
+            np.divide(x_b, d, out=ratios, where=d > tol)
+            leaving_row = int(np.argmin(ratios))
+            if bland: # Empates na razão mínima: sai a variável básica de menor índice
+                ties = np.flatnonzero(ratios == ratios[leaving_row])
+                leaving_row = int(ties[np.argmin(basic_indices[ties])])
+            degenerate_streak = degenerate_streak + 1 if x_b[leaving_row] <= tol else 0
+            z += cj_q * ratios[leaving_row] # z + (cj - zj) * theta
+
+            # Atualização dos pesos Devex pela linha pivô alpha_r = e_r^T B^-1 A
+            if devex:
+                e_r = np.zeros(m)
+                e_r[leaving_row] = 1.0
+                alpha_r = eta_file.btran(e_r) @ A
+                alpha_q = d[leaving_row]
+                w_q = weights[entering_idx]
+                np.maximum(weights, (alpha_r / alpha_q)**2 * w_q, out=weights)
+                weights[basic_indices[leaving_row]] = max(w_q / alpha_q**2, 1.0)
+
+            in_basis[basic_indices[leaving_row]] = False
+            in_basis[entering_idx] = True
             basic_indices[leaving_row] = entering_idx
+            eta_file.update(leaving_row, d)
         
         return {'status': 'max_iterations_reached'}
 
@@ -257,7 +683,9 @@ class Simplex:
 
         # Fase 2: Preparar e resolver o tableau para a otimização
         tableau, basic_indices = self._prepare_phase2_tableau(tableau, basic_indices, artificial_indices)
-        return self._tabular_simplex_engine(tableau, basic_indices, self.c)
+        # Dados originais para o refinamento, necessários só em precisão reduzida
+        reference = np.column_stack((self._A64, self._b64)) if self.dtype != np.float64 else None
+        return self._tabular_simplex_engine(tableau, basic_indices, self._c64, reference)
         
     def _build_and_run_phase1_tabular(self):
         """
@@ -276,30 +704,38 @@ class Simplex:
         """
 
 
-        num_artificial = sum(1 for sign in self.signs if sign in ['>=', '='])
-        num_slack = self.num_vars - self.n_parser_vars
+        m, n_parser, signs, b = self.m, self.n_parser_vars, self.signs, self._b64
+        # Restrições >= com b = 0 não precisam de artificial (ver `_run_phase1_revised`)
+        num_artificial = sum(1 for i, sign in enumerate(signs) if sign == '=' or (sign == '>=' and b[i] > 0))
+        num_slack = self.num_vars - n_parser
         
-        # Monta o tableau da Fase 1
-        tableau_width = self.n_parser_vars + num_slack + num_artificial + 1
-        tableau = np.zeros((self.m, tableau_width))
-        tableau[:, :self.n_parser_vars] = self.A[:, :self.n_parser_vars]
-        tableau[:, -1] = self.b
+        # Monta o tableau da Fase 1 em float64 (convertido à precisão de trabalho ao final)
+        tableau_width = n_parser + num_slack + num_artificial + 1
+        tableau = np.zeros((m, tableau_width))
+        tableau[:, :n_parser] = self._A64[:, :n_parser]
+        tableau[:, -1] = b
         
-        basic_indices = [-1] * self.m
+        basic_indices = np.full(m, -1, dtype=np.intp)
         artificial_indices = []
         
         c_phase1 = np.zeros(tableau_width - 1)
         
         # Preenche o tableau com as variáveis de folga, excesso e artificiais
-        slack_ptr = self.n_parser_vars
-        art_ptr = self.n_parser_vars + num_slack
+        slack_ptr = n_parser
+        art_ptr = n_parser + num_slack
         
-        for i in range(self.m):
-            sign = self.signs[i]
+        for i in range(m):
+            sign = signs[i]
             if sign == '<=':
                 tableau[i, slack_ptr] = 1.0
                 basic_indices[i] = slack_ptr
                 slack_ptr += 1
+            elif sign == '>=' and b[i] == 0:
+                # A linha é multiplicada por -1 para que a variável de excesso tenha coluna +e_i
+                tableau[i, :n_parser] *= -1
+                tableau[i, slack_ptr] = 1.0
+                basic_indices[i] = slack_ptr
+                slack_ptr += 1
             else: # >= ou =
                 if sign == '>=':
                     tableau[i, slack_ptr] = -1.0
@@ -309,12 +745,22 @@ class Simplex:
                 artificial_indices.append(art_ptr)
                 c_phase1[art_ptr] = -1.0 # max -w
                 art_ptr += 1
+        assert m == 0 or basic_indices.min() >= 0, "Base inicial da Fase 1 incompleta"
+
+        # Em precisão reduzida, o tableau em float64 é a referência do refinamento
+        reference = None
+        if self.dtype != np.float64:
+            reference, tableau = tableau, tableau.astype(self.dtype)
+
+        # Sem variáveis artificiais a base inicial já é factível e a Fase 1 é dispensada
+        if not artificial_indices:
+            return tableau, basic_indices, artificial_indices, 'optimal'
 
         # Resolve o problema da Fase 1
-        result = self._tabular_simplex_engine(tableau, basic_indices, c_phase1)
+        result = self._tabular_simplex_engine(tableau, basic_indices, c_phase1, reference)
         
         # Verifica se a Fase 1 encontrou uma solução factível
-        if result.get('status') != 'optimal' or abs(result.get('value', 0)) > 1e-9:
+        if result.get('status') != 'optimal' or abs(result.get('value', 0)) > self.tol:
             return None, None, None, 'infeasible'
         
         return result['tableau'], result['final_basis_indices'], artificial_indices, 'optimal'
@@ -340,81 +786,83 @@ class Simplex:
         
         # Mapeia os índices da base antigos para os novos
         map_old_to_new = {old: new for new, old in enumerate(cols_to_keep)}
-        new_basic_indices = [map_old_to_new[b] for b in basic_indices]
+        new_basic_indices = np.array([map_old_to_new[b] for b in basic_indices], dtype=np.intp)
         
         return tableau, new_basic_indices
 
-    def _tabular_simplex_engine(self, tableau_init, basic_indices_init, c_original):
+    def _tabular_simplex_engine(self, tableau_init, basic_indices_init, c_original, reference=None):
         """
             Motor principal que executa as iterações do algoritmo Simplex Tabular.
 
+            As iterações são feitas por `_tabular_iterations_jit` (compilado com Numba)
+            quando disponível, ou por `_tabular_iterations` (NumPy) caso contrário.
+
             Args:
                 tableau_init (np.array): O tableau inicial para a fase atual.
                 basic_indices_init (list): A lista inicial de índices da base.
-                c_original (np.array): O vetor de custos original para esta fase.
+                c_original (np.array): O vetor de custos original para esta fase (o valor final é
+                                       calculado com ele em float64).
+                reference (np.array, optional): Tableau com os dados originais do problema (mesmas
+                                                colunas de `tableau_init`) usado no refinamento em
+                                                float64. Default é o próprio `tableau_init`.
 
             Returns:
                 dict: Um dicionário descrevendo o resultado da otimização ('optimal', 'unbounded', etc.).
         """
         tableau = np.copy(tableau_init)
-        basic_indices = list(basic_indices_init)
+        basic_indices = np.array(basic_indices_init, dtype=np.intp)
+        c_exact = np.asarray(c_original, dtype=np.float64) # Custos originais, para o valor final
+        c_original = np.asarray(c_original, dtype=tableau.dtype)
         num_vars = tableau.shape[1] - 1
         
         # Limite de iterações para evitar loops infinitos
-        for _ in range(self.m * num_vars * 2):
-            # Calcula os custos reduzidos (linha cj - zj)
-            cb = c_original[basic_indices]
-            zj = cb @ tableau[:, :-1]
-            cj_zj = c_original - zj
-
-            # Zera os custos reduzidos das variáveis básicas por precisão numérica
-            cj_zj[basic_indices] = 0
-
-           # Condição de otimalidade
-            if np.all(cj_zj <= 1e-9):
-                solution = np.zeros(num_vars)
-                for i, idx in enumerate(basic_indices):
-                    solution[idx] = tableau[i, -1]
-                
-                # Checa por múltiplas soluções nas variáveis NÃO básicas
-                non_basic_indices = np.setdiff1d(np.arange(num_vars), basic_indices)
-                has_multiple_solutions = np.any(np.isclose(cj_zj[non_basic_indices], 0))
-
-                return {
-                    'status': 'optimal',
-                    'solution': solution,
-                    'value': cb @ solution[basic_indices],
-                    'is_degenerate': np.any(np.isclose(tableau[:, -1], 0)),
-                    'has_multiple_solutions': has_multiple_solutions,
-                    'tableau': tableau,
-                    'final_basis_indices': basic_indices
-                }
-
-            # Escolhe a variável para entrar na base
-            entering_col = np.argmax(cj_zj)
-            
-            # Condição de solução ilimitada
-            if np.all(tableau[:, entering_col] <= 1e-9):
-                return {'status': 'unbounded'}
-
-            # Teste da razão para escolher a variável que sai da base
-            ratios = np.array([tableau[i, -1] / tableau[i, entering_col] if tableau[i, entering_col] > 1e-9 else np.inf for i in range(self.m)])
-            leaving_row = np.argmin(ratios)
-            
-            # Realiza o pivoteamento para atualizar o tableau
-            pivot_element = tableau[leaving_row, entering_col]
-            if abs(pivot_element) < 1e-9:
-                return {'status': 'error_numerical_instability'}
-            
-            tableau[leaving_row, :] /= pivot_element
-            for i in range(self.m):
-                if i != leaving_row:
-                    tableau[i, :] -= tableau[i, entering_col] * tableau[leaving_row, :]
-            
-            # Atualiza a base
-            basic_indices[leaving_row] = entering_col
-
-        return {'status': 'max_iterations_reached'}
+        max_iter = self.m * num_vars * 2
+        iterate = _tabular_iterations_jit if _tabular_iterations_jit is not None else _tabular_iterations
+        if tableau.dtype == np.float64:
+            status, cj_zj = iterate(tableau, basic_indices, c_original, max_iter, self.tol)
+            rhs = tableau[:, -1]
+        else:
+            # Precisão reduzida: itera em blocos e, entre eles, recalcula a coluna do lado direito
+            # em float64 a partir dos dados originais (tableau = B^-1 reference)
+            tableau_64 = np.asarray(tableau_init if reference is None else reference, dtype=np.float64)
+            # Valores válidos mesmo se o laço não executar (max_iter == 0, sem restrições)
+            status, cj_zj, rhs = _MAX_ITERATIONS, np.zeros(num_vars), tableau[:, -1].astype(np.float64)
+            for done in range(0, max_iter, _REFINE_INTERVAL):
+                status, cj_zj = iterate(tableau, basic_indices, c_original, min(_REFINE_INTERVAL, max_iter - done), self.tol)
+                if status in (_UNBOUNDED, _NUMERICAL_INSTABILITY):
+                    break
+                rhs = _solve_basis_float64(tableau_64[:, basic_indices], tableau_64[:, -1])
+                if rhs is None:
+                    rhs = tableau[:, -1].astype(np.float64)
+                tableau[:, -1] = rhs
+                if status == _OPTIMAL:
+                    break
+
+        if status == _UNBOUNDED:
+            return {'status': 'unbounded'}
+        if status == _NUMERICAL_INSTABILITY:
+            return {'status': 'error_numerical_instability'}
+        if status == _MAX_ITERATIONS:
+            return {'status': 'max_iterations_reached'}
+
+        cb = c_exact[basic_indices]
+        solution = np.zeros(num_vars)
+        solution[basic_indices] = rhs
+        
+        # Checa por múltiplas soluções nas variáveis NÃO básicas (máscara em O(m), sem ordenação)
+        in_basis = np.zeros(num_vars, dtype=bool)
+        in_basis[basic_indices] = True
+        has_multiple_solutions = np.any(np.isclose(cj_zj[~in_basis], 0))
+
+        return {
+            'status': 'optimal',
+            'solution': solution,
+            'value': cb @ solution[basic_indices],
+            'is_degenerate': np.any(np.isclose(tableau[:, -1], 0)),
+            'has_multiple_solutions': has_multiple_solutions,
+            'tableau': tableau,
+            'final_basis_indices': basic_indices
+        }
 
     # --------------------------------------------------------------------------
     # PÓS-PROCESSAMENTO
@@ -442,20 +890,15 @@ class Simplex:
             return result
 
         sol_vector = result['solution']
-        final_sol = {}
 
-        # Usa o 'interpretation_info' para reverter a solução para as variáveis originais
-        for var, info in self.interpretation_info['simplex_vars_map'].items():
-            cols = info['cols_parser']
-            if info['type'] == 'free':
-                final_sol[var] = sol_vector[cols[0]] - sol_vector[cols[1]]
-            else:
-                final_sol[var] = sol_vector[cols[0]] * info['mult']
-        
-        ordered_sol = [final_sol[v] for v in self.interpretation_info['sorted_original_vars']]
+        # Reverte a solução para as variáveis originais (livres: x = x_p - x_n; demais: x = mult * x')
+        ordered_sol = np.empty(self._n_orig_vars)
+        ordered_sol[self._free_out_idx] = sol_vector[self._free_pos_idx] - sol_vector[self._free_neg_idx]
+        ordered_sol[self._nonfree_out_idx] = sol_vector[self._nonfree_idx] * self._nonfree_mult
         
-        # Recalcula o valor da função objetivo com base nos coeficientes do problema original
-        final_value = self.c_parser_vars @ ordered_sol
+        # Recalcula o valor da função objetivo com os coeficientes das colunas do parser,
+        # que têm o mesmo valor que o objetivo original nas variáveis originais
+        final_value = self.c_parser_vars @ sol_vector[:self.n_parser_vars]
         
         return {'status': 'optimal', 'solution': ordered_sol,
                 'value': -final_value if self.was_min else final_value,